@@ -1,20 +1,45 @@
 """Streamlit web interface for the hotel reservation chatbot."""
 from __future__ import annotations
 
+import json
+
 import streamlit as st
+
 from bot import HotelChatbot
 
 
-def init_bot():
-    """Initialize chatbot once and cache in session state."""
-    if "bot" not in st.session_state:
-        with st.spinner("Training chatbot model with keyword matching..."):
-            st.session_state.bot = HotelChatbot(
-                auto_train=True, 
-                confidence_threshold=0.25,
-                use_keyword_fallback=True
-            )
+@st.cache_resource(show_spinner="Training chatbot model with keyword matching...")
+def get_bot() -> HotelChatbot:
+    """Build the chatbot once per process; trained model and CSVs are shared."""
+    return HotelChatbot(
+        auto_train=True,
+        confidence_threshold=0.25,
+        use_keyword_fallback=True,
+    )
+
+
+@st.cache_data(show_spinner=False)
+def render_context_summary(context_uid: int, version: int, _context) -> str:
+    """Build the sidebar summary only when the context actually changed.
+
+    Keyed on the context's process-unique uid, not id(): addresses are
+    reused after garbage collection, so an id()-based key could serve one
+    session's cached summary to another.
+    """
+    return _context.get_context_summary()
+
+
+def init_bot() -> HotelChatbot:
+    """Fetch the shared chatbot and ensure this session has conversation state.
+
+    The bot is shared across sessions, so the session's context is never
+    pre-bound here; every respond() call passes it explicitly instead.
+    """
+    bot = get_bot()
+    if "context" not in st.session_state:
+        st.session_state.context = bot.new_context()
         st.session_state.messages = []
+    return bot
 
 
 def main():
@@ -23,7 +48,7 @@ def main():
     st.title("🏨 Sunset Bay Hotel Chatbot")
     st.markdown("**Ask me anything about reservations, rooms, amenities, and policies!**")
     
-    init_bot()
+    bot = init_bot()
     
     # Sidebar with info
     with st.sidebar:
@@ -66,28 +91,28 @@ def main():
                 st.rerun()
         with col2:
             if st.button("🔄 Reset Context"):
-                st.session_state.bot.reset_context()
+                bot.reset_context(st.session_state.context)
                 st.session_state.messages.append({
                     "role": "assistant",
                     "content": "Conversation context cleared. How can I help you?",
-                    "metadata": {"intent": "system", "confidence": 1.0, "entities": {}}
+                    "metadata_json": json.dumps({"intent": "system", "confidence": 1.0, "entities": {}}, indent=2),
                 })
                 st.rerun()
         
         # Show current context
-        if st.session_state.bot:
-            context_summary = st.session_state.bot.get_context().get_context_summary()
-            st.markdown("---")
-            st.subheader("💭 Current Context")
-            st.text(context_summary)
+        context = st.session_state.context
+        context_summary = render_context_summary(context.uid, context.version, context)
+        st.markdown("---")
+        st.subheader("💭 Current Context")
+        st.text(context_summary)
     
     # Display chat history
     for msg in st.session_state.messages:
         with st.chat_message(msg["role"]):
             st.markdown(msg["content"])
-            if msg["role"] == "assistant" and "metadata" in msg:
+            if msg["role"] == "assistant" and "metadata_json" in msg:
                 with st.expander("🔍 Analysis"):
-                    st.json(msg["metadata"])
+                    st.code(msg["metadata_json"], language="json")
     
     # Chat input
     user_input = st.chat_input("Type your message here...")
@@ -106,7 +131,7 @@ def main():
         # Get bot response
         with st.chat_message("assistant"):
             with st.spinner("Thinking..."):
-                result = st.session_state.bot.respond(user_input)
+                result = bot.respond(user_input, context=st.session_state.context)
             
             response_text = result["response"]
             st.markdown(response_text)
@@ -123,16 +148,19 @@ def main():
             if result["intent"] == "invalid_input" and "validation" in result:
                 metadata["validation"] = result["validation"]
             
+            # Serialize once at append time so history reruns skip st.json's
+            # per-rerun serializer and the raw dict doesn't linger in session state
+            metadata_json = json.dumps(metadata, indent=2, default=str)
             with st.expander("🔍 Analysis"):
-                st.json(metadata)
+                st.code(metadata_json, language="json")
             
             st.session_state.messages.append({
                 "role": "assistant",
                 "content": response_text,
-                "metadata": metadata,
+                "metadata_json": metadata_json,
             })
-        
-        st.rerun()
+        # No explicit st.rerun(): the current turn is already rendered inline
+        # above, and st.chat_input triggers its own rerun on the next submit.
 
 
 if __name__ == "__main__":
@@ -1,12 +1,24 @@
 """Conversation context manager for persistent memory."""
 from __future__ import annotations
 
+import itertools
+import time
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Deque, Dict, List, Optional
 
+if TYPE_CHECKING:
+    from .entity_extractor import EntityResult
 
-@dataclass
+# Cap conversation history so long sessions stay O(1) per append and bounded in memory
+HISTORY_MAXLEN = 200
+
+# Process-unique context ids; unlike id(), these are never reused after a
+# context is garbage-collected, so they are safe in long-lived cache keys
+_context_ids = itertools.count(1)
+
+
+@dataclass(slots=True)
 class ConversationContext:
     """Stores conversation state and user preferences."""
     
@@ -29,40 +41,53 @@ class ConversationContext:
     reservation_id: Optional[str] = None
     confirmed: bool = False
     
-    # Conversation history
-    message_history: List[Dict[str, str]] = field(default_factory=list)
+    # Conversation history (bounded; oldest messages are dropped first)
+    message_history: Deque[Dict[str, object]] = field(default_factory=lambda: deque(maxlen=HISTORY_MAXLEN))
     last_intent: Optional[str] = None
     
     # User preferences (learned over time)
     preferred_room_type: Optional[str] = None
     special_requests: List[str] = field(default_factory=list)
+
+    # Cache-key identity: (uid, version) names one state of one context
+    uid: int = field(default_factory=lambda: next(_context_ids), init=False)
+    _version: int = field(default=0, init=False, repr=False)
+
+    @property
+    def version(self) -> int:
+        """Monotonic counter bumped on every mutation."""
+        return self._version
     
-    def update_from_entities(self, entities: Dict[str, object]) -> None:
+    def update_from_entities(self, entities: "EntityResult") -> None:
         """Update context from extracted entities."""
-        if entities.get("check_in"):
-            self.check_in = str(entities["check_in"])
-        if entities.get("check_out"):
-            self.check_out = str(entities["check_out"])
-        if entities.get("room_type"):
-            self.room_type = str(entities["room_type"])
-        if entities.get("room_code"):
-            self.room_code = str(entities["room_code"])
-        if entities.get("adults"):
-            self.adults = int(entities["adults"])
-        if entities.get("children"):
-            self.children = int(entities["children"])
-        if entities.get("guests_total"):
-            self.guests_total = int(entities["guests_total"])
-        if entities.get("reservation_id"):
-            self.reservation_id = str(entities["reservation_id"])
+        self._version += 1
+        if entities.check_in:
+            self.check_in = entities.check_in
+        if entities.check_out:
+            self.check_out = entities.check_out
+        if entities.room_type:
+            self.room_type = entities.room_type
+        if entities.room_code:
+            self.room_code = entities.room_code
+        if entities.adults:
+            self.adults = entities.adults
+        if entities.children:
+            self.children = entities.children
+        if entities.guests_total:
+            self.guests_total = entities.guests_total
+        if entities.reservation_id:
+            self.reservation_id = entities.reservation_id
     
     def add_message(self, role: str, content: str, intent: Optional[str] = None) -> None:
         """Add a message to conversation history."""
+        self._version += 1
+        # Store a raw time.time() float; consumers that display timestamps can
+        # format lazily (datetime.fromtimestamp) instead of paying isoformat here
         self.message_history.append({
             "role": role,
             "content": content,
             "intent": intent or "unknown",
-            "timestamp": datetime.now().isoformat(),
+            "ts": time.time(),
         })
         if intent:
             self.last_intent = intent
@@ -107,6 +132,7 @@ class ConversationContext:
     
     def clear_booking(self) -> None:
         """Clear current booking information."""
+        self._version += 1
         self.check_in = None
         self.check_out = None
         self.room_type = None
@@ -3,28 +3,48 @@ from __future__ import annotations
 
 import csv
 import json
+import string
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence
+from typing import Dict, Iterable, List, Sequence, Tuple
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # stdlib fallback; orjson is an optional speedup
+    _loads = json.loads
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class TrainingRow:
     utterance: str
     intent: str
-    entities: Dict[str, object]
+    # Raw JSON column; decoded on demand since training never reads it
+    entities_json: str
     context: str
     language: str
     channel: str
     sentiment: str
 
+    @property
+    def entities(self) -> Dict[str, object]:
+        """Entity annotations, parsed lazily from the raw JSON column."""
+        try:
+            return _loads(self.entities_json)
+        except (ValueError, TypeError):
+            return {}
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HotelInfo:
     metadata: Dict[str, str]
     room_types: Sequence[Dict[str, object]]
+    rooms_by_code: Dict[str, Dict[str, object]]
     amenity_faq: Dict[str, str]
     responses: Dict[str, str]
+    # Placeholder names referenced by each response template, parsed once at load
+    response_placeholders: Dict[str, frozenset]
 
 
 def _read_csv(path: Path) -> Iterable[Dict[str, str]]:
@@ -37,15 +57,11 @@ def _read_csv(path: Path) -> Iterable[Dict[str, str]]:
 def load_training_rows(path: Path) -> List[TrainingRow]:
     rows: List[TrainingRow] = []
     for row in _read_csv(path):
-        try:
-            entities = json.loads(row.get("entities", "{}"))
-        except json.JSONDecodeError:
-            entities = {}
         rows.append(
             TrainingRow(
                 utterance=row.get("utterance", ""),
                 intent=row.get("intent", "unknown"),
-                entities=entities,
+                entities_json=row.get("entities", "{}"),
                 context=row.get("context", "general"),
                 language=row.get("language", "en"),
                 channel=row.get("channel", "web"),
@@ -55,22 +71,67 @@ def load_training_rows(path: Path) -> List[TrainingRow]:
     return rows
 
 
+def load_training_corpus(path: Path) -> Tuple[List[str], List[str]]:
+    """Load only the utterance/intent columns used for classifier training.
+
+    Classifier training never consults the entity JSON or metadata columns, so
+    this fast path skips per-row dataclass construction and json.loads and uses
+    csv.reader with positional indexing instead of DictReader.
+    """
+    utterances: List[str] = []
+    intents: List[str] = []
+    with path.open("r", encoding="utf-8") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if not header:
+            return utterances, intents
+        utterance_idx = header.index("utterance")
+        intent_idx = header.index("intent")
+        width = max(utterance_idx, intent_idx)
+        for row in reader:
+            if len(row) <= width:
+                continue
+            utterances.append(row[utterance_idx])
+            intents.append(row[intent_idx])
+    return utterances, intents
+
+
 def load_hotel_info(
     info_path: Path,
     rooms_path: Path,
     faq_path: Path,
     responses_path: Path,
 ) -> HotelInfo:
-    info_rows = list(_read_csv(info_path))
+    # The four CSVs are independent; overlap their disk reads
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        info_rows, room_rows, faq_rows, response_list = executor.map(
+            lambda path: list(_read_csv(path)),
+            (info_path, rooms_path, faq_path, responses_path),
+        )
     metadata = info_rows[0] if info_rows else {}
 
-    room_rows = list(_read_csv(rooms_path))
     for room in room_rows:
         room["view_options"] = [v.strip() for v in room.get("view_options", "").split(",") if v]
         room["amenities"] = [v.strip() for v in room.get("amenities", "").split(",") if v]
 
-    amenity_faq = {row["amenity"]: row["answer"] for row in _read_csv(faq_path)}
+    rooms_by_code = {room["code"]: room for room in room_rows if room.get("code")}
+
+    amenity_faq = {row["amenity"]: row["answer"] for row in faq_rows}
 
-    response_rows = {row["intent"]: row["template"] for row in _read_csv(responses_path)}
+    response_rows = {row["intent"]: row["template"] for row in response_list}
+    formatter = string.Formatter()
+    response_placeholders = {
+        intent: frozenset(
+            field_name for _, field_name, _, _ in formatter.parse(template) if field_name
+        )
+        for intent, template in response_rows.items()
+    }
 
-    return HotelInfo(metadata=metadata, room_types=room_rows, amenity_faq=amenity_faq, responses=response_rows)
+    return HotelInfo(
+        metadata=metadata,
+        room_types=room_rows,
+        rooms_by_code=rooms_by_code,
+        amenity_faq=amenity_faq,
+        responses=response_rows,
+        response_placeholders=response_placeholders,
+    )
@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import random
+import string
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 from .data_loader import HotelInfo
 from .context_manager import ConversationContext
+from .entity_extractor import EntityResult
 
 
 class DialogueManager:
@@ -14,6 +16,15 @@ class DialogueManager:
         self.hotel_info = hotel_info
         self.responses = hotel_info.responses
         self.default_response = "I'm not sure I understood that. Could you rephrase?"
+        # Templates parsed once into (literal, field, spec, conversion) parts
+        # so rendering is a list join instead of re-parsing the format string
+        # every turn; spec and conversion are kept so templates like
+        # "{price:.2f}" or "{x!r}" render exactly as str.format would
+        formatter = string.Formatter()
+        self._compiled: Dict[str, List[Tuple[str, Optional[str], Optional[str], Optional[str]]]] = {
+            intent: list(formatter.parse(template))
+            for intent, template in self.responses.items()
+        }
         self.context = context or ConversationContext(
             hotel_name=hotel_info.metadata.get("name", "Sunset Bay Hotel"),
             hotel_address=hotel_info.metadata.get("address", ""),
@@ -21,21 +32,31 @@ class DialogueManager:
             hotel_email=hotel_info.metadata.get("email", ""),
         )
 
-    def respond(self, intent: str, entities: Dict[str, object]) -> str:
+    def respond(self, intent: str, entities: EntityResult) -> str:
         # Update conversation context with new entities
         self.context.update_from_entities(entities)
         
         # Build response context using both current entities and remembered context
-        template = self.responses.get(intent) or self.responses.get("unknown", self.default_response)
-        response_context = self._build_context(intent, entities)
-        
-        try:
-            response = template.format(**response_context)
-            
-            return response
-        except KeyError:
-            # Missing placeholder -> fall back to default response
+        parts = self._compiled.get(intent) or self._compiled.get("unknown")
+        if parts is None:
             return self.default_response
+        response_context = self._build_context(intent, entities)
+
+        # Missing fields render as empty strings; no KeyError fallback needed
+        rendered: List[str] = []
+        for literal, field_name, format_spec, conversion in parts:
+            if literal:
+                rendered.append(literal)
+            if field_name is not None:
+                value = response_context.get(field_name, "")
+                if conversion == "r":
+                    value = repr(value)
+                elif conversion == "a":
+                    value = ascii(value)
+                elif conversion == "s":
+                    value = str(value)
+                rendered.append(format(value, format_spec) if format_spec else str(value))
+        return "".join(rendered)
     
     def _format_remembered_context(self) -> str:
         """Format remembered context for display."""
@@ -53,63 +74,76 @@ class DialogueManager:
             parts.append(f"Guests: {guest_text}")
         return " | ".join(parts)
 
-    def _build_context(self, intent: str, entities: Dict[str, object]) -> Dict[str, object]:
-        # Use remembered context as fallback for missing entities
-        hotel_name = self.hotel_info.metadata.get("name", "our hotel")
-        
-        # Use current entities or fall back to remembered context
-        room_type = (
-            entities.get("room_type") or 
-            self._lookup_room_name(entities.get("room_code")) or
-            self.context.room_type or
-            "room"
-        )
-        room_code = entities.get("room_code") or self.context.room_code
-        
-        adults = entities.get("adults") or self.context.adults
-        children = entities.get("children") or self.context.children
-        check_in = entities.get("check_in") or self.context.check_in or "your arrival date"
-        check_out = entities.get("check_out") or self.context.check_out or "your departure date"
-        guests_total = entities.get("guests_total") or self.context.guests_total or adults or "your group"
-        amenity = entities.get("amenity", "the amenity")
-        price = self._estimate_price(room_code, check_in if check_in != "your arrival date" else None)
-        reservation_id = entities.get("reservation_id") or self.context.reservation_id or "your reservation"
-        
-        children_txt = ""
-        if isinstance(children, int) and children > 0:
-            children_txt = f"and {children} children"
+    def _placeholders_for(self, intent: str) -> frozenset:
+        """Placeholder names used by the template that respond() will render."""
+        placeholders = self.hotel_info.response_placeholders
+        if intent in self.responses:
+            return placeholders.get(intent, frozenset())
+        return placeholders.get("unknown", frozenset())
 
-        context = {
-            "hotel_name": hotel_name,
-            "room_type": room_type,
-            "check_in": check_in,
-            "check_out": check_out,
-            "nights": entities.get("nights", ""),
-            "adults": adults or guests_total,
-            "children": children,
-            "children_txt": children_txt,
-            "guests_total": guests_total,
-            "amenity": amenity,
-            "price": price or "our nightly rate",
-            "reservation_id": reservation_id,
-        }
+    def _build_context(self, intent: str, entities: EntityResult) -> Dict[str, object]:
+        # Only compute the values the chosen template actually interpolates;
+        # everything else would be formatted and thrown away
+        placeholders = self._placeholders_for(intent)
+        context: Dict[str, object] = {}
+        if not placeholders:
+            return context
+
+        # Use current entities or fall back to remembered context (cheap reads)
+        room_code = entities.room_code or self.context.room_code
+        adults = entities.adults or self.context.adults
+        children = entities.children or self.context.children
+        check_in = entities.check_in or self.context.check_in or "your arrival date"
+        guests_total = entities.guests_total or self.context.guests_total or adults or "your group"
 
-        if intent == "inquire_price" and price is None:
-            context["price"] = self._estimate_price("STD", datetime.now().date().isoformat()) or 150
+        if "hotel_name" in placeholders:
+            context["hotel_name"] = self.hotel_info.metadata.get("name", "our hotel")
+        if "room_type" in placeholders:
+            context["room_type"] = (
+                entities.room_type or
+                self._lookup_room_name(entities.room_code) or
+                self.context.room_type or
+                "room"
+            )
+        if "check_in" in placeholders:
+            context["check_in"] = check_in
+        if "check_out" in placeholders:
+            context["check_out"] = entities.check_out or self.context.check_out or "your departure date"
+        if "nights" in placeholders:
+            context["nights"] = entities.nights if entities.nights is not None else ""
+        if "adults" in placeholders:
+            context["adults"] = adults or guests_total
+        if "children" in placeholders:
+            context["children"] = children
+        if "children_txt" in placeholders:
+            children_txt = ""
+            if isinstance(children, int) and children > 0:
+                children_txt = f"and {children} children"
+            context["children_txt"] = children_txt
+        if "guests_total" in placeholders:
+            context["guests_total"] = guests_total
+        if "amenity" in placeholders:
+            context["amenity"] = entities.amenity or "the amenity"
+        if "price" in placeholders:
+            # Pricing calls random.uniform and date parsing; only paid for here
+            price = self._estimate_price(room_code, check_in if check_in != "your arrival date" else None)
+            if intent == "inquire_price" and price is None:
+                price = self._estimate_price("STD", datetime.now().date().isoformat()) or 150
+            context["price"] = price or "our nightly rate"
+        if "reservation_id" in placeholders:
+            context["reservation_id"] = entities.reservation_id or self.context.reservation_id or "your reservation"
         return context
 
     def _lookup_room_name(self, code: Optional[str]) -> Optional[str]:
         if not code:
             return None
-        for room in self.hotel_info.room_types:
-            if room.get("code") == code:
-                return room.get("name")
-        return None
+        room = self.hotel_info.rooms_by_code.get(code)
+        return room.get("name") if room else None
 
     def _estimate_price(self, room_code: Optional[str], check_in: Optional[str]) -> Optional[float]:
         if not room_code:
             return None
-        room = next((r for r in self.hotel_info.room_types if r.get("code") == room_code), None)
+        room = self.hotel_info.rooms_by_code.get(room_code)
         if not room:
             return None
         base = room.get("base_price_weekday")
@@ -2,17 +2,58 @@
 from __future__ import annotations
 
 import re
+from dataclasses import dataclass, fields
 from typing import Dict, List, Optional
 
+try:
+    import ahocorasick
+except ImportError:  # optional speedup; substring scan is used when missing
+    ahocorasick = None
+
 from .data_loader import HotelInfo
 
-DATE_PATTERN = re.compile(r"\b\d{4}-\d{2}-\d{2}\b")
-NIGHTS_PATTERN = re.compile(r"(\d+)\s+nights?")
-ADULT_PATTERN = re.compile(r"(\d+)\s+(?:adult|adults)")
-CHILD_PATTERN = re.compile(r"(\d+)\s+(?:child|children|kid|kids)")
-TOTAL_GUEST_PATTERN = re.compile(r"(\d+)\s+(?:guest|guests|people)")
-RESERVATION_PATTERN = re.compile(r"\b[a-f0-9]{8}\b")
-TIME_PATTERN = re.compile(r"(\d{1,2})(?::(\d{2}))?\s*(am|pm)")
+@dataclass(slots=True)
+class EntityResult:
+    """Entities extracted from a single utterance.
+
+    Slots give fixed-offset attribute access for the many downstream reads in
+    DialogueManager; as_dict() provides the dict view used for display.
+    """
+
+    raw_text: str = ""
+    check_in: Optional[str] = None
+    check_out: Optional[str] = None
+    nights: Optional[int] = None
+    adults: Optional[int] = None
+    children: Optional[int] = None
+    guests_total: Optional[int] = None
+    reservation_id: Optional[str] = None
+    time_request: Optional[str] = None
+    amenity: Optional[str] = None
+    room_code: Optional[str] = None
+    room_type: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, object]:
+        """Dict of extracted entities, omitting fields that were not found."""
+        result: Dict[str, object] = {"raw_text": self.raw_text}
+        for spec in fields(self):
+            value = getattr(self, spec.name)
+            if spec.name != "raw_text" and value is not None:
+                result[spec.name] = value
+        return result
+
+
+# All numeric/date entities fused into one alternation with named groups so a
+# single finditer() pass replaces seven independent scans of the utterance.
+COMBINED_PATTERN = re.compile(
+    r"(?P<date>\b\d{4}-\d{2}-\d{2}\b)"
+    r"|(?P<nights>\d+)\s+nights?"
+    r"|(?P<adults>\d+)\s+adults?"
+    r"|(?P<children>\d+)\s+(?:child|children|kid|kids)"
+    r"|(?P<guests>\d+)\s+(?:guest|guests|people)"
+    r"|(?P<reservation>\b[a-f0-9]{8}\b)"
+    r"|(?P<time_hour>\d{1,2})(?::(?P<time_minute>\d{2}))?\s*(?P<time_meridiem>am|pm)"
+)
 
 
 class EntityExtractor:
@@ -22,6 +63,9 @@ class EntityExtractor:
         self.hotel_info = hotel_info
         self.room_synonyms = self._build_room_synonyms()
         self.amenity_keywords = {k.lower(): k for k in hotel_info.amenity_faq.keys()}
+        self._automaton = self._build_automaton()
+        # Longest-first order for the fallback scan, computed once instead of per call
+        self._sorted_synonyms = sorted(self.room_synonyms.items(), key=lambda x: len(x[0]), reverse=True)
 
     def _build_room_synonyms(self) -> Dict[str, Dict[str, str]]:
         synonyms: Dict[str, Dict[str, str]] = {}
@@ -67,58 +111,90 @@ class EntityExtractor:
                 synonyms[label] = {"room_code": code, "room_type": name}
         return synonyms
     
+    def _build_automaton(self):
+        """Compile room synonyms and amenity keywords into one Aho-Corasick automaton.
+
+        A single O(len(text)) pass then replaces the per-keyword substring scans
+        in extract(). Returns None when pyahocorasick is not installed.
+        """
+        if ahocorasick is None:
+            return None
+        entries: Dict[str, List[tuple]] = {}
+        for keyword, amenity in self.amenity_keywords.items():
+            entries.setdefault(keyword, []).append(("amenity", len(keyword), amenity))
+        for label, payload in self.room_synonyms.items():
+            entries.setdefault(label, []).append(("room", len(label), payload))
+        automaton = ahocorasick.Automaton()
+        for word, payloads in entries.items():
+            automaton.add_word(word, payloads)
+        automaton.make_automaton()
+        return automaton
+
     def _get_room_name(self, code: str) -> str:
-        for room in self.hotel_info.room_types:
-            if room.get("code") == code:
-                return room.get("name", code)
-        return code
+        room = self.hotel_info.rooms_by_code.get(code)
+        return room.get("name", code) if room else code
 
-    def extract(self, utterance: str) -> Dict[str, object]:
+    def extract(self, utterance: str) -> EntityResult:
+        # Normalize case once; every matcher below runs on the lowered string.
         text = utterance.lower()
-        entities: Dict[str, object] = {
-            "raw_text": utterance,
-        }
-
-        dates = DATE_PATTERN.findall(utterance)
+        result = EntityResult(raw_text=utterance)
+
+        dates: List[str] = []
+        for match in COMBINED_PATTERN.finditer(text):
+            group = match.lastgroup
+            if group == "date":
+                dates.append(match.group("date"))
+            elif group == "nights":
+                if result.nights is None:
+                    result.nights = int(match.group("nights"))
+            elif group == "adults":
+                if result.adults is None:
+                    result.adults = int(match.group("adults"))
+            elif group == "children":
+                if result.children is None:
+                    result.children = int(match.group("children"))
+            elif group == "guests":
+                if result.guests_total is None:
+                    result.guests_total = int(match.group("guests"))
+            elif group == "reservation":
+                if result.reservation_id is None:
+                    result.reservation_id = match.group("reservation")
+            elif group == "time_meridiem" and result.time_request is None:
+                hour = int(match.group("time_hour"))
+                minute = int(match.group("time_minute") or 0)
+                meridiem = match.group("time_meridiem")
+                result.time_request = f"{hour:02d}:{minute:02d} {meridiem}"
         if dates:
-            entities["check_in"] = dates[0]
+            result.check_in = dates[0]
         if len(dates) >= 2:
-            entities["check_out"] = dates[1]
-        nights_match = NIGHTS_PATTERN.search(text)
-        if nights_match:
-            entities["nights"] = int(nights_match.group(1))
-
-        adults_match = ADULT_PATTERN.search(text)
-        if adults_match:
-            entities["adults"] = int(adults_match.group(1))
-        children_match = CHILD_PATTERN.search(text)
-        if children_match:
-            entities["children"] = int(children_match.group(1))
-        total_match = TOTAL_GUEST_PATTERN.search(text)
-        if total_match:
-            entities["guests_total"] = int(total_match.group(1))
-
-        res_match = RESERVATION_PATTERN.search(text)
-        if res_match:
-            entities["reservation_id"] = res_match.group(0)
-
-        time_match = TIME_PATTERN.search(text)
-        if time_match:
-            hour = int(time_match.group(1))
-            minute = int(time_match.group(2) or 0)
-            meridiem = time_match.group(3)
-            entities["time_request"] = f"{hour:02d}:{minute:02d} {meridiem}"
-
-        for keyword, amenity in self.amenity_keywords.items():
-            if keyword in text:
-                entities["amenity"] = amenity
-                break
-
-        # Sort room synonyms by length (longest first) to match "ocean suite" before "ocean"
-        sorted_synonyms = sorted(self.room_synonyms.items(), key=lambda x: len(x[0]), reverse=True)
-        for label, payload in sorted_synonyms:
-            if label and label in text:
-                entities.update(payload)
-                break
-
-        return entities
+            result.check_out = dates[1]
+
+        best_room: Optional[Dict[str, str]] = None
+        if self._automaton is not None:
+            # One linear pass; longest room label wins ("ocean suite" over "ocean")
+            best_room_len = 0
+            for _, payloads in self._automaton.iter(text):
+                for kind, length, payload in payloads:
+                    if kind == "amenity":
+                        if result.amenity is None:
+                            result.amenity = payload
+                    elif length > best_room_len:
+                        best_room = payload
+                        best_room_len = length
+        else:
+            for keyword, amenity in self.amenity_keywords.items():
+                if keyword in text:
+                    result.amenity = amenity
+                    break
+
+            # Longest labels first so "ocean suite" matches before "ocean"
+            for label, payload in self._sorted_synonyms:
+                if label and label in text:
+                    best_room = payload
+                    break
+
+        if best_room:
+            result.room_code = best_room["room_code"]
+            result.room_type = best_room["room_type"]
+
+        return result
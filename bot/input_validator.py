@@ -2,80 +2,161 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Dict, Tuple
 
+from .validation_kernels import real_word_scan
 
-class InputValidator:
-    """Validates user input to detect real questions vs gibberish/random text."""
-    
-    def __init__(self):
-        # Question indicators
-        self.question_words = {
-            "what", "when", "where", "who", "why", "how", "which", "whose",
-            "can", "could", "would", "should", "will", "do", "does", "did",
-            "is", "are", "was", "were", "has", "have", "had", "am",
-            "tell", "show", "give", "get", "need", "want", "looking",
-            "explain", "describe", "say", "know",
-        }
-        
-        # Hotel/booking related keywords (valid domain)
-        self.domain_keywords = {
-            # Booking/Reservation
-            "book", "booking", "reserve", "reservation", "cancel", "cancellation",
-            "confirm", "modify", "change", "update",
-            
-            # Room related
-            "room", "suite", "deluxe", "standard", "family", "ocean", "type",
-            "available", "availability", "vacant", "free",
-            
-            # Dates and time
-            "date", "day", "night", "week", "month", "today", "tomorrow",
-            "check-in", "checkin", "check-out", "checkout", "arrival", "departure",
-            "stay", "staying", "arrive", "leave",
-            
-            # Pricing
-            "price", "cost", "rate", "charge", "fee", "pay", "payment",
-            "expensive", "cheap", "discount", "total",
-            
-            # Hotel facilities/amenities
-            "amenity", "amenities", "facility", "facilities", "service", "services",
-            "pool", "gym", "spa", "wifi", "parking", "breakfast", "restaurant",
-            "pet", "pets", "dog", "cat",
-            
-            # People
-            "guest", "guests", "adult", "adults", "child", "children", "kid", "kids",
-            "people", "person",
-            
-            # Policies
-            "policy", "policies", "rule", "rules", "regulation",
-            
-            # Hotel info
-            "hotel", "address", "location", "phone", "email", "contact",
-            
-            # Common actions
-            "need", "want", "like", "prefer", "looking", "search", "find",
-            "help", "information", "info", "details", "tell", "know",
-            
-            # Greetings and politeness (acceptable)
-            "hello", "hi", "hey", "greetings", "thanks", "thank", "please",
-            "bye", "goodbye", "yes", "no", "ok", "okay",
-            
-            # Identity/info questions (acceptable)
-            "you", "your", "who", "name", "about", "information",
-        }
-        
-        # Common short greetings to allow
-        self.allowed_short_words = {"hi", "ok", "no"}
-        
-        # Patterns that indicate gibberish
-        self.gibberish_patterns = [
-            r'^[a-z]{1,2}$',  # Single or two random letters
+# Compiled once at import; validate() runs these on every user turn
+_WORD_TOKEN_RE = re.compile(r"\b[a-z]+\b")
+
+# Topics the bot explicitly refuses when a question has no hotel keywords.
+# Matching is exact per token, so common plural/inflected forms are listed
+# alongside the base words ("movies" would otherwise slip past "movie").
+_OFF_TOPIC_KEYWORDS = frozenset({
+    "capital", "capitals", "country", "countries", "president", "presidents",
+    "cook", "cooking", "recipe", "recipes", "weather",
+    "math", "calculate", "physics", "chemistry", "science", "sciences",
+    "sports", "game", "games", "movie", "movies", "song", "songs",
+    "music", "actor", "actors",
+    "politics", "news", "stock", "stocks", "market", "markets", "crypto",
+    "programming", "code", "python", "javascript",
+})
+
+# Greetings, polite phrases, and identity questions accepted without domain
+# keywords, fused into one alternation so acceptance is a single regex scan
+_ACCEPTABLE_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"\b(hi|hello|hey|good\s+(morning|afternoon|evening|day))\b",
+            r"\b(thank|thanks|thx|ty)\b",
+            r"\b(bye|goodbye|see\s+you)\b",
+            r"\b(yes|yea|yeah|yep|no|nope)\b",
+            r"\b(ok|okay|sure|fine|alright)\b",
+            r"\b(who|what)\s+(are|is)\s+you\b",  # "who are you", "what are you"
+            r"\b(tell|say)\s+(me\s+)?(about\s+)?(you|yourself)\b",  # "tell me about you"
+            r"\byour\s+(name|info|information)\b",  # "your name", "your information"
+        )
+    )
+)
+
+
+# Question indicators
+_QUESTION_WORDS = frozenset({
+    "what", "when", "where", "who", "why", "how", "which", "whose",
+    "can", "could", "would", "should", "will", "do", "does", "did",
+    "is", "are", "was", "were", "has", "have", "had", "am",
+    "tell", "show", "give", "get", "need", "want", "looking",
+    "explain", "describe", "say", "know",
+})
+
+# Hotel/booking related keywords (valid domain). Matching is exact per
+# token, so common plural/inflected forms are listed alongside the base
+# words ("rooms" would otherwise slip past "room").
+_DOMAIN_KEYWORDS = frozenset({
+    # Booking/Reservation
+    "book", "booking", "bookings", "reserve", "reservation", "reservations",
+    "cancel", "cancellation", "cancellations",
+    "confirm", "modify", "change", "update",
+
+    # Room related
+    "room", "rooms", "suite", "suites", "deluxe", "standard", "family",
+    "ocean", "type", "types",
+    "available", "availability", "vacant", "free",
+
+    # Dates and time
+    "date", "dates", "day", "days", "night", "nights", "week", "weeks",
+    "month", "months", "today", "tomorrow",
+    "check-in", "checkin", "check-out", "checkout", "arrival", "departure",
+    "stay", "stays", "staying", "arrive", "leave",
+
+    # Pricing
+    "price", "prices", "cost", "costs", "rate", "rates", "charge", "charges",
+    "fee", "fees", "pay", "payment", "payments",
+    "expensive", "cheap", "discount", "discounts", "total",
+
+    # Hotel facilities/amenities
+    "amenity", "amenities", "facility", "facilities", "service", "services",
+    "pool", "pools", "gym", "gyms", "spa", "spas", "wifi", "parking",
+    "breakfast", "restaurant", "restaurants",
+    "pet", "pets", "dog", "dogs", "cat", "cats",
+
+    # People
+    "guest", "guests", "adult", "adults", "child", "children", "kid", "kids",
+    "people", "person",
+
+    # Policies
+    "policy", "policies", "rule", "rules", "regulation",
+
+    # Hotel info
+    "hotel", "hotels", "address", "location", "phone", "email", "contact",
+
+    # Common actions
+    "need", "want", "like", "prefer", "looking", "search", "find",
+    "help", "information", "info", "details", "tell", "know",
+
+    # Greetings and politeness (acceptable); "hiya" and "cheers" appear as
+    # greet/thanks utterances throughout the training corpus
+    "hello", "hi", "hiya", "hey", "greetings", "thanks", "thank", "cheers",
+    "please", "bye", "goodbye", "yes", "no", "ok", "okay",
+
+    # Identity/info questions (acceptable)
+    "you", "your", "who", "name", "about", "information",
+})
+
+# Single-token keywords can be tested by set intersection; hyphenated or
+# multi-word entries still need a substring pass
+_DOMAIN_SINGLE = frozenset(k for k in _DOMAIN_KEYWORDS if k.isalpha())
+_DOMAIN_PHRASES = tuple(k for k in _DOMAIN_KEYWORDS if not k.isalpha())
+
+# Common short greetings to allow
+_ALLOWED_SHORT = frozenset({"hi", "ok", "no"})
+
+# Patterns that indicate gibberish, fused into alternations: the caller only
+# cares that some pattern matched, so one scan covers each bucket. The
+# fully-anchored patterns can never match input containing a space, so they
+# are skipped for multi-word text.
+_GIBBERISH_SHORT_RE = re.compile(r'^[a-z]{1,2}$')  # Single or two random letters
+_SPECIAL_CHARS = frozenset("!@#$%^&*()")  # Only special characters
+_GIBBERISH_ALWAYS_RE = re.compile(
+    "|".join(
+        f"(?:{p})"
+        for p in (
             r'^(.)\1{3,}',  # Repeated character (e.g., "aaaaa")
             r'^[^aeiou\s]{5,}',  # Too many consonants without vowels
-            r'^\d+$',  # Only numbers
-            r'^[!@#$%^&*()]+$',  # Only special characters
             r'^[a-z]+\d+[a-z]+\d+',  # Mixed random letters and numbers
-        ]
+        )
+    )
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_likely_real_word(word: str) -> bool:
+    """Check if a word looks like a real English word.
+
+    The vocabulary of user inputs is small and repetitive, so the verdict is
+    memoized per word; cache misses run the compiled scan when numba is
+    available and the identical pure-Python loop otherwise.
+    """
+    if len(word) < 2:
+        return True  # Single letters are okay
+    return real_word_scan(word)
+
+
+class InputValidator:
+    """Validates user input to detect real questions vs gibberish/random text.
+
+    All keyword sets and patterns live at module scope, so instances are
+    stateless and construction is just attribute binding.
+    """
+
+    def __init__(self):
+        self.question_words = _QUESTION_WORDS
+        self.domain_keywords = _DOMAIN_KEYWORDS
+        self._domain_single = _DOMAIN_SINGLE
+        self._domain_phrases = _DOMAIN_PHRASES
+        self.allowed_short_words = _ALLOWED_SHORT
     
     def validate(self, text: str) -> Tuple[bool, str, Dict[str, object]]:
         """
@@ -92,21 +173,46 @@ class InputValidator:
         
         text_clean = text.strip().lower()
         
+        # Checks are ordered cheapest-and-most-decisive first: trivial rejects
+        # and the allowed-short fast accept resolve before any tokenization
+        
         # Check minimum length
         if len(text_clean) < 2:
             return False, "Please ask a complete question. I'm here to help with hotel reservations, room information, amenities, and policies.", {"reason": "too_short"}
         
-        # Check for gibberish patterns (but allow common short words)
-        if text_clean not in self.allowed_short_words:
-            for pattern in self.gibberish_patterns:
-                if re.match(pattern, text_clean):
-                    # Allow if it's in domain keywords or question words
-                    if text_clean not in self.domain_keywords and text_clean not in self.question_words:
-                        return False, "That doesn't seem like a valid question. Please ask about hotel reservations, room availability, pricing, or our services.", {"reason": "gibberish_pattern"}
+        if text_clean in self.allowed_short_words:
+            # "hi"/"ok"/"no" always reach the domain-keyword accept; answer
+            # directly with the analysis the full path would have produced
+            return True, "", {
+                "has_question_word": False,
+                "has_question_mark": '?' in text,
+                "has_domain_keyword": True,
+                "word_validity_ratio": 1.0,
+                "word_count": 1,
+            }
+        
+        # Check for gibberish patterns; the anchored single-word checks only
+        # run on space-free input, with all-digit and all-special-character
+        # inputs caught by str methods and set membership instead of regexes
+        if (
+            _GIBBERISH_ALWAYS_RE.match(text_clean)
+            or (
+                ' ' not in text_clean
+                and (
+                    _GIBBERISH_SHORT_RE.match(text_clean)
+                    or text_clean.isdigit()
+                    or not set(text_clean) - _SPECIAL_CHARS
+                )
+            )
+        ):
+            # Allow if it's in domain keywords or question words
+            if text_clean not in self.domain_keywords and text_clean not in self.question_words:
+                return False, "That doesn't seem like a valid question. Please ask about hotel reservations, room availability, pricing, or our services.", {"reason": "gibberish_pattern"}
         
-        # Check if it's just repeated words
+        # Check if it's just repeated words (early-exits on the first
+        # differing word instead of building a set)
         words = text_clean.split()
-        if len(words) > 2 and len(set(words)) == 1:
+        if len(words) > 2 and all(w == words[0] for w in words):
             return False, "Please ask a meaningful question. I can help you with bookings, room types, amenities, check-in/out times, and hotel policies.", {"reason": "repeated_words"}
         
         # Check for single long gibberish-looking word (like aklsdfhasdihf)
@@ -117,19 +223,28 @@ class InputValidator:
                 if text_clean not in self.domain_keywords and text_clean not in self.question_words:
                     return False, "That doesn't look like a valid word or question. Please ask about hotel reservations, room availability, pricing, or our services.", {"reason": "gibberish_word"}
         
-        # Analyze content
-        has_question_word = any(word in text_clean for word in self.question_words)
+        # Analyze content with hashed set intersections over the token set
+        # instead of one substring scan per keyword
+        word_tokens = _WORD_TOKEN_RE.findall(text_clean)
+        token_set = frozenset(word_tokens)
+        has_question_word = bool(token_set & self.question_words)
         has_question_mark = '?' in text
-        has_domain_keyword = any(keyword in text_clean for keyword in self.domain_keywords)
-        
-        # Calculate word validity score
-        word_tokens = re.findall(r'\b[a-z]+\b', text_clean)
-        if word_tokens:
-            # Check if words look like real words (have vowels, reasonable length)
-            valid_words = sum(1 for word in word_tokens if self._is_likely_real_word(word))
-            word_validity_ratio = valid_words / len(word_tokens)
+        has_domain_keyword = bool(token_set & self._domain_single) or any(
+            phrase in text_clean for phrase in self._domain_phrases
+        )
+        
+        # Per-word validity is only priced in when a later branch can consult
+        # it: short inputs that already carry an accept indicator skip the
+        # scan entirely (their discarded analysis reports the ratio as None)
+        if len(word_tokens) > 2 or not (has_question_word or has_domain_keyword):
+            if word_tokens:
+                # Check if words look like real words (have vowels, reasonable length)
+                valid_words = sum(1 for word in word_tokens if self._is_likely_real_word(word))
+                word_validity_ratio = valid_words / len(word_tokens)
+            else:
+                word_validity_ratio = 0.0
         else:
-            word_validity_ratio = 0.0
+            word_validity_ratio = None
         
         analysis = {
             "has_question_word": has_question_word,
@@ -145,27 +260,21 @@ class InputValidator:
                 return False, "I'm a hotel chatbot. Please ask a question about:\n• Room bookings and availability\n• Pricing and rates\n• Hotel amenities and services\n• Check-in/check-out policies\n• Contact information", {"reason": "single_invalid_word", "analysis": analysis}
         
         # Check word validity - if too many invalid-looking words
-        if word_validity_ratio < 0.3 and len(word_tokens) > 2:
+        if len(word_tokens) > 2 and word_validity_ratio < 0.3:
             return False, "I couldn't understand that. Please ask a clear question about hotel services, such as:\n• 'Do you have rooms available?'\n• 'What's the price for a deluxe room?'\n• 'When is check-in time?'", {"reason": "low_word_validity", "analysis": analysis}
         
         # Check for off-topic/random content
         # If it has question word but NO domain keywords, likely off-topic
         if (has_question_word or has_question_mark) and not has_domain_keyword and len(words) > 2:
             # Check for common off-topic question patterns
-            off_topic_keywords = {
-                "capital", "country", "president", "cook", "recipe", "weather",
-                "math", "calculate", "physics", "chemistry", "science",
-                "sports", "game", "movie", "song", "music", "actor",
-                "politics", "news", "stock", "market", "crypto",
-                "programming", "code", "python", "javascript",
-            }
-            if any(keyword in text_clean for keyword in off_topic_keywords):
+            if token_set & _OFF_TOPIC_KEYWORDS:
                 return False, "I'm a hotel reservation assistant and can only help with hotel-related questions like:\n✓ Room bookings and availability\n✓ Pricing and rates\n✓ Amenities and services\n✓ Check-in/check-out policies\n✓ Hotel information\n\nPlease ask something about your hotel stay.", {"reason": "off_topic_detected", "analysis": analysis}
         
         # More general off-topic check
         if not has_domain_keyword and not has_question_word and len(words) > 2:
-            # Might be off-topic
-            if word_validity_ratio < 0.6:
+            # Might be off-topic; a refused-topic keyword ("weather in paris")
+            # rejects even when the words themselves look real
+            if token_set & _OFF_TOPIC_KEYWORDS or word_validity_ratio < 0.6:
                 return False, "That doesn't seem related to hotel services. I can help you with:\n✓ Room reservations\n✓ Availability and pricing\n✓ Amenities (WiFi, parking, pets, etc.)\n✓ Hotel policies\n\nWhat would you like to know?", {"reason": "off_topic", "analysis": analysis}
         
         # Valid input - has question indicators or domain keywords
@@ -173,20 +282,8 @@ class InputValidator:
             return True, "", analysis
         
         # Check if it looks like a greeting, polite phrase, or identity question
-        acceptable_patterns = [
-            r'\b(hi|hello|hey|good\s+(morning|afternoon|evening|day))\b',
-            r'\b(thank|thanks|thx|ty)\b',
-            r'\b(bye|goodbye|see\s+you)\b',
-            r'\b(yes|yea|yeah|yep|no|nope)\b',
-            r'\b(ok|okay|sure|fine|alright)\b',
-            r'\b(who|what)\s+(are|is)\s+you\b',  # "who are you", "what are you"
-            r'\b(tell|say)\s+(me\s+)?(about\s+)?(you|yourself)\b',  # "tell me about you"
-            r'\byour\s+(name|info|information)\b',  # "your name", "your information"
-        ]
-        
-        for pattern in acceptable_patterns:
-            if re.search(pattern, text_clean):
-                return True, "", analysis
+        if _ACCEPTABLE_RE.search(text_clean):
+            return True, "", analysis
         
         # If we get here, treat it as potentially valid but questionable
         if word_validity_ratio >= 0.5:
@@ -197,24 +294,7 @@ class InputValidator:
     
     def _is_likely_real_word(self, word: str) -> bool:
         """Check if a word looks like a real English word."""
-        if len(word) < 2:
-            return True  # Single letters are okay
-        
-        # Must have at least one vowel (or y)
-        if not re.search(r'[aeiouy]', word):
-            return False
-        
-        # Check for reasonable consonant clusters
-        # Too many consonants in a row is suspicious
-        consonant_clusters = re.findall(r'[^aeiouy\s]{4,}', word)
-        if consonant_clusters:
-            return False
-        
-        # Check for repeated patterns that look wrong
-        if len(word) > 3:
-            # Same 2-char pattern repeated
-            for i in range(len(word) - 3):
-                if word[i:i+2] == word[i+2:i+4]:
-                    return False
-        
-        return True
+        return _is_likely_real_word(word)
+
+# Shared stateless instance; callers that don't need their own can reuse it
+DEFAULT_VALIDATOR = InputValidator()
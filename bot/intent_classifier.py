@@ -1,18 +1,54 @@
 """Intent classifier built on scikit-learn with keyword fallback."""
 from __future__ import annotations
 
+import re
+from collections import OrderedDict
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 
 import joblib
+import numpy as np
 from sklearn.linear_model import LogisticRegression
 from sklearn.pipeline import Pipeline
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 from .config import MODEL_PATH, VECTORIZER_PATH, ensure_model_dir
 from .data_loader import TrainingRow
-from .keyword_matcher import KeywordMatcher
+from .keyword_matcher import _INTENT_KEYWORDS, DEFAULT_MATCHER
+
+# Chat inputs repeat constantly ("yes", "hi", "do you have parking"); bound the
+# memoized prediction caches so repeats skip vectorization entirely
+_PREDICT_CACHE_MAX = 1024
+
+# Single-word acknowledgment intents worth answering with a dict lookup
+_TRIVIAL_INTENTS = ("greet", "goodbye", "thanks", "confirm", "deny")
+
+
+def _build_exact_intents() -> dict:
+    """Trigger phrases that map unambiguously to one trivial intent.
+
+    Phrases shared with any other intent's keyword groups (e.g. "cancel",
+    which also drives cancel_reservation) are excluded.
+    """
+    owners: dict = {}
+    for intent, groups in _INTENT_KEYWORDS.items():
+        for group in groups:
+            for phrase in group:
+                owners.setdefault(phrase, set()).add(intent)
+    return {
+        phrase: intent
+        for intent in _TRIVIAL_INTENTS
+        for group in _INTENT_KEYWORDS[intent]
+        for phrase in group
+        if owners[phrase] == {intent}
+    }
+
+
+_EXACT_INTENT = _build_exact_intents()
+
+# Same token shape TfidfVectorizer uses by default, compiled once
+_TFIDF_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
 
 
 @dataclass
@@ -24,12 +60,78 @@ class IntentPrediction:
 class IntentClassifier:
     def __init__(self, use_keyword_fallback: bool = True) -> None:
         self.pipeline: Pipeline | None = None
-        self.keyword_matcher = KeywordMatcher() if use_keyword_fallback else None
+        self.keyword_matcher = DEFAULT_MATCHER if use_keyword_fallback else None
+        self._predict_cache: OrderedDict[tuple, IntentPrediction] = OrderedDict()
+        self._top_k_cache: OrderedDict[tuple, List[IntentPrediction]] = OrderedDict()
+        # Pipeline internals bound after train/load so the hot path skips
+        # sklearn's per-call Pipeline dispatch and validation
+        self._vec = None
+        self._clf = None
+        self._classes = None
+
+    def _bind_pipeline(self) -> None:
+        self._vec = self.pipeline.named_steps["tfidf"]
+        self._clf = self.pipeline.named_steps["clf"]
+        self._classes = self._clf.classes_
+        # Dense inference weights: vectorizing one short text through numpy
+        # avoids CountVectorizer's per-call machinery and CSR construction
+        self._vocab = self._vec.vocabulary_
+        self._idf = self._vec.idf_
+        self._coef = self._clf.coef_
+        self._intercept = self._clf.intercept_
+
+    def _predict_proba(self, text: str) -> np.ndarray:
+        """Class probabilities for one text via precomputed dense weights.
+
+        Replicates TfidfVectorizer (1-2 grams, l2 norm) and multinomial
+        LogisticRegression inference without sparse-matrix plumbing.
+        """
+        tokens = _TFIDF_TOKEN_RE.findall(text.lower())
+        vocab_get = self._vocab.get
+        counts: Dict[int, int] = {}
+        for tok in tokens:
+            idx = vocab_get(tok)
+            if idx is not None:
+                counts[idx] = counts.get(idx, 0) + 1
+        for i in range(len(tokens) - 1):
+            idx = vocab_get(tokens[i] + " " + tokens[i + 1])
+            if idx is not None:
+                counts[idx] = counts.get(idx, 0) + 1
+
+        if counts:
+            idxs = np.fromiter(counts.keys(), dtype=np.intp, count=len(counts))
+            vals = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+            vals *= self._idf[idxs]
+            vals /= np.linalg.norm(vals)
+            scores = self._coef[:, idxs] @ vals + self._intercept
+        else:
+            scores = self._intercept
+        scores = scores - scores.max()
+        np.exp(scores, out=scores)
+        return scores / scores.sum()
+
+    def _clear_caches(self) -> None:
+        self._predict_cache.clear()
+        self._top_k_cache.clear()
+
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: tuple):
+        hit = cache.get(key)
+        if hit is not None:
+            cache.move_to_end(key)
+        return hit
+
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key: tuple, value) -> None:
+        cache[key] = value
+        if len(cache) > _PREDICT_CACHE_MAX:
+            cache.popitem(last=False)
 
     def train(self, rows: Sequence[TrainingRow]) -> None:
+        self.train_corpus([row.utterance for row in rows], [row.intent for row in rows])
+
+    def train_corpus(self, texts: Sequence[str], labels: Sequence[str]) -> None:
         ensure_model_dir()
-        texts = [row.utterance for row in rows]
-        labels = [row.intent for row in rows]
         self.pipeline = Pipeline(
             steps=[
                 (
@@ -47,50 +149,115 @@ class IntentClassifier:
             ]
         )
         self.pipeline.fit(texts, labels)
-        joblib.dump(self.pipeline, MODEL_PATH)
+        self._bind_pipeline()
+        self._clear_caches()
+        # Protocol 5 keeps the large vocab/coef buffers out-of-band so the
+        # mmap-backed load below can reference them without copying
+        joblib.dump(self.pipeline, MODEL_PATH, protocol=5)
 
     def load(self, model_path: Path = MODEL_PATH) -> None:
         if not model_path.exists():
             raise FileNotFoundError("Trained model not found. Run train() first.")
-        self.pipeline = joblib.load(model_path)
+        # Memory-map the numpy payloads (idf, coefficients) instead of
+        # deserializing copies; the OS pages them in on first use
+        self.pipeline = joblib.load(model_path, mmap_mode="r")
+        self._bind_pipeline()
+        self._clear_caches()
 
     def predict(self, text: str, confidence_threshold: float = 0.25) -> IntentPrediction:
         """Predict intent with keyword fallback for better paraphrase handling."""
         if not self.pipeline:
             raise RuntimeError("Classifier not trained or loaded.")
-        
-        # Try ML-based classification first
-        probs = self.pipeline.predict_proba([text])[0]
-        intents = self.pipeline.classes_
+
+        text_clean = text.strip().lower()
+
+        # Trivial acknowledgments ("hi", "yes", "thanks") skip TF-IDF entirely
+        exact_intent = _EXACT_INTENT.get(text_clean)
+        if exact_intent is not None:
+            return IntentPrediction(intent=exact_intent, confidence=0.99)
+
+        cache_key = (text_clean, confidence_threshold)
+        cached = self._cache_get(self._predict_cache, cache_key)
+        if cached is not None:
+            return cached
+
+        # Try ML-based classification first on the dense numpy path
+        probs = self._predict_proba(text)
         max_idx = probs.argmax()
-        ml_prediction = IntentPrediction(intent=intents[max_idx], confidence=float(probs[max_idx]))
+        ml_prediction = IntentPrediction(intent=self._classes[max_idx], confidence=float(probs[max_idx]))
         
-        # If ML confidence is high enough, use it
-        if ml_prediction.confidence >= confidence_threshold:
-            return ml_prediction
-        
-        # Otherwise, try keyword matching as fallback
-        if self.keyword_matcher:
+        prediction = ml_prediction
+        # If ML confidence is too low, try keyword matching as fallback
+        if ml_prediction.confidence < confidence_threshold and self.keyword_matcher:
             keyword_match = self.keyword_matcher.match(text, min_score=1.0)
             if keyword_match:
                 keyword_intent, keyword_confidence = keyword_match
                 # Boost confidence slightly to indicate keyword match
                 boosted_confidence = min(keyword_confidence * 1.2, 0.95)
-                return IntentPrediction(intent=keyword_intent, confidence=boosted_confidence)
-        
-        # Return ML prediction even if confidence is low
-        return ml_prediction
+                prediction = IntentPrediction(intent=keyword_intent, confidence=boosted_confidence)
+
+        self._cache_put(self._predict_cache, cache_key, prediction)
+        return prediction
+
+    def predict_batch(self, texts: Sequence[str], confidence_threshold: float = 0.25) -> List[IntentPrediction]:
+        """Predict intents for many independent texts in one scoring pass.
+
+        Result-for-result equivalent to calling predict() per text: exact
+        trigger phrases and cached entries resolve immediately, and only the
+        remainder goes through a single batched transform/predict_proba call.
+        """
+        if not self.pipeline:
+            raise RuntimeError("Classifier not trained or loaded.")
+
+        results: List[Optional[IntentPrediction]] = [None] * len(texts)
+        pending: List[int] = []
+        for i, text in enumerate(texts):
+            text_clean = text.strip().lower()
+            exact_intent = _EXACT_INTENT.get(text_clean)
+            if exact_intent is not None:
+                results[i] = IntentPrediction(intent=exact_intent, confidence=0.99)
+                continue
+            cached = self._cache_get(self._predict_cache, (text_clean, confidence_threshold))
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append(i)
+
+        if pending:
+            probs = self._clf.predict_proba(self._vec.transform([texts[i] for i in pending]))
+            for i, row in zip(pending, probs):
+                max_idx = row.argmax()
+                prediction = IntentPrediction(intent=self._classes[max_idx], confidence=float(row[max_idx]))
+                if prediction.confidence < confidence_threshold and self.keyword_matcher:
+                    keyword_match = self.keyword_matcher.match(texts[i], min_score=1.0)
+                    if keyword_match:
+                        keyword_intent, keyword_confidence = keyword_match
+                        prediction = IntentPrediction(
+                            intent=keyword_intent,
+                            confidence=min(keyword_confidence * 1.2, 0.95),
+                        )
+                self._cache_put(self._predict_cache, (texts[i].strip().lower(), confidence_threshold), prediction)
+                results[i] = prediction
+        return results
 
     def top_k(self, text: str, k: int = 3) -> List[IntentPrediction]:
         """Get top K predictions combining ML and keyword matching."""
         if not self.pipeline:
             raise RuntimeError("Classifier not trained or loaded.")
-        
-        # Get ML predictions
-        probs = self.pipeline.predict_proba([text])[0]
-        intents = self.pipeline.classes_
-        sorted_indices = probs.argsort()[::-1][:k]
-        ml_predictions = [IntentPrediction(intent=intents[i], confidence=float(probs[i])) for i in sorted_indices]
+
+        cache_key = (text.strip().lower(), k)
+        cached = self._cache_get(self._top_k_cache, cache_key)
+        if cached is not None:
+            return cached
+
+        # Get ML predictions; argpartition only sorts the k winners
+        probs = self._predict_proba(text)
+        if k < len(probs):
+            top_idx = np.argpartition(probs, -k)[-k:]
+            sorted_indices = top_idx[np.argsort(probs[top_idx])[::-1]]
+        else:
+            sorted_indices = probs.argsort()[::-1]
+        ml_predictions = [IntentPrediction(intent=self._classes[i], confidence=float(probs[i])) for i in sorted_indices]
         
         # Add keyword predictions if available
         if self.keyword_matcher:
@@ -105,6 +272,9 @@ class IntentClassifier:
             
             # Sort by confidence and return top k
             merged = sorted(all_predictions.values(), key=lambda x: x.confidence, reverse=True)
-            return merged[:k]
-        
-        return ml_predictions
+            result = merged[:k]
+        else:
+            result = ml_predictions
+
+        self._cache_put(self._top_k_cache, cache_key, result)
+        return result
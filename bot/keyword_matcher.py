@@ -1,121 +1,199 @@
 """Keyword-based intent matching for paraphrase handling."""
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
+import re
+from types import MappingProxyType
+from typing import Dict, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # optional speedup; per-phrase substring scan is used when missing
+    ahocorasick = None
+
+# Token shape used by the fallback matcher; hyphenated keywords like
+# "check-in" survive as single tokens
+_TOKEN_RE = re.compile(r"[a-z-]+")
+
+
+# Keyword patterns for each intent with synonyms, defined once at import as
+# immutable tuple-of-tuples shared by every matcher instance
+_INTENT_KEYWORDS: Dict[str, Tuple[Tuple[str, ...], ...]] = {
+    "greet": (
+        ("hello", "hi", "hey", "greetings", "good morning", "good afternoon", "good evening"),
+    ),
+    "goodbye": (
+        ("bye", "goodbye", "see you", "later", "farewell", "exit", "quit"),
+    ),
+    "thanks": (
+        ("thank", "thanks", "appreciate", "grateful", "thx"),
+    ),
+    "inquire_identity": (
+        ("who", "you"),  # "who are you"
+        ("what", "you"),  # "what are you"
+    ),
+    "inquire_availability": (
+        ("available", "availability", "check", "vacant", "free", "open"),
+        ("room", "rooms", "booking", "reservation"),
+    ),
+    "inquire_price": (
+        ("price", "cost", "rate", "charge", "fee", "how much", "expensive", "cheap"),
+    ),
+    "inquire_room_type": (
+        ("room type", "types of room", "what room", "which room", "room option", "category"),
+    ),
+    "inquire_amenities": (
+        ("amenity", "amenities", "facility", "facilities", "service", "services", "feature", "features"),
+        ("have", "offer", "provide", "include", "available"),
+    ),
+    "inquire_cancellation_policy": (
+        ("cancel", "cancellation", "refund", "policy", "cancel policy", "refund policy"),
+    ),
+    "inquire_checkin_time": (
+        ("check in", "check-in", "checkin", "arrival", "arrive", "come in"),
+        ("time", "hour", "when", "what time"),
+    ),
+    "inquire_checkout_time": (
+        ("check out", "check-out", "checkout", "departure", "depart", "leave"),
+        ("time", "hour", "when", "what time"),
+    ),
+    "inquire_parking": (
+        ("parking", "park", "car park", "garage", "vehicle"),
+    ),
+    "inquire_pet_policy": (
+        ("pet", "pets", "dog", "cat", "animal"),
+    ),
+    "make_reservation": (
+        ("book", "reserve", "reservation", "booking", "want to book", "make a reservation"),
+    ),
+    "change_dates": (
+        ("change", "modify", "update", "adjust"),
+        ("date", "dates", "day", "days"),
+    ),
+    "change_room_type": (
+        ("change", "modify", "update", "switch", "upgrade"),
+        ("room", "room type"),
+    ),
+    "change_guest_count": (
+        ("change", "modify", "update", "adjust"),
+        ("guest", "guests", "people", "person", "adult", "adults", "children"),
+    ),
+    "cancel_reservation": (
+        ("cancel", "cancellation", "abort", "remove"),
+        ("reservation", "booking"),
+    ),
+    "confirm": (
+        ("yes", "confirm", "ok", "okay", "sure", "proceed", "go ahead", "correct", "right"),
+    ),
+    "deny": (
+        ("no", "nope", "cancel", "don't", "never mind", "not now", "wrong"),
+    ),
+    "request_late_checkout": (
+        ("late", "extend", "later"),
+        ("checkout", "check out", "check-out"),
+    ),
+    "request_early_checkin": (
+        ("early", "earlier", "before"),
+        ("checkin", "check in", "check-in", "arrival"),
+    ),
+    "request_invoice": (
+        ("invoice", "receipt", "bill", "statement", "payment confirmation"),
+    ),
+    "complaint_noise": (
+        ("noise", "noisy", "loud", "sound"),
+        ("complaint", "complain", "problem", "issue"),
+    ),
+    "complaint_cleanliness": (
+        ("clean", "cleanliness", "dirty", "mess", "tidy"),
+        ("complaint", "complain", "problem", "issue"),
+    ),
+    "complaint_billing": (
+        ("billing", "charge", "payment", "invoice", "bill"),
+        ("complaint", "complain", "problem", "issue", "wrong", "error"),
+    ),
+    "feedback_positive": (
+        ("great", "excellent", "wonderful", "amazing", "love", "fantastic", "perfect", "good job"),
+    ),
+    "feedback_negative": (
+        ("bad", "terrible", "awful", "horrible", "disappointed", "poor", "worst"),
+    ),
+}
+
+# Weight for each match level (read-only; shared across instances)
+_WEIGHTS = MappingProxyType({
+    "exact_phrase": 3.0,
+    "all_keywords": 2.0,
+    "partial_keywords": 1.0,
+})
+
+# Fallback-path layout: per group, single-token keywords go in a frozenset
+# (hashed intersection with the tokenized input) while phrases with spaces
+# or apostrophes keep the substring scan
+_INTENT_DATA: Dict[str, List[Tuple[frozenset, Tuple[str, ...]]]] = {
+    intent: [
+        (
+            frozenset(p for p in group if _TOKEN_RE.fullmatch(p)),
+            tuple(p for p in group if not _TOKEN_RE.fullmatch(p)),
+        )
+        for group in keyword_groups
+    ]
+    for intent, keyword_groups in _INTENT_KEYWORDS.items()
+}
+
+
+def _build_automaton():
+    """Compile every intent phrase into one Aho-Corasick automaton.
+
+    One linear pass over the input then yields all matching phrases for all
+    intents at once, instead of a substring scan per phrase per intent.
+    Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+    entries: Dict[str, List[Tuple[str, int]]] = {}
+    for intent, keyword_groups in _INTENT_KEYWORDS.items():
+        for group_idx, group in enumerate(keyword_groups):
+            for phrase in group:
+                entries.setdefault(phrase, []).append((intent, group_idx))
+    automaton = ahocorasick.Automaton()
+    for phrase, owners in entries.items():
+        automaton.add_word(phrase, owners)
+    automaton.make_automaton()
+    return automaton
+
+
+_AUTOMATON = _build_automaton()
 
 
 class KeywordMatcher:
-    """Enhanced keyword matcher with synonym support for better paraphrase handling."""
-    
+    """Enhanced keyword matcher with synonym support for better paraphrase handling.
+
+    All keyword tables and the automaton are built once at import; instances
+    just bind the shared structures.
+    """
+
     def __init__(self):
-        # Define keyword patterns for each intent with synonyms
-        self.intent_keywords: Dict[str, List[List[str]]] = {
-            "greet": [
-                ["hello", "hi", "hey", "greetings", "good morning", "good afternoon", "good evening"],
-            ],
-            "goodbye": [
-                ["bye", "goodbye", "see you", "later", "farewell", "exit", "quit"],
-            ],
-            "thanks": [
-                ["thank", "thanks", "appreciate", "grateful", "thx"],
-            ],
-            "inquire_identity": [
-                ["who", "you"],  # "who are you"
-                ["what", "you"],  # "what are you"
-            ],
-            "inquire_availability": [
-                ["available", "availability", "check", "vacant", "free", "open"],
-                ["room", "rooms", "booking", "reservation"],
-            ],
-            "inquire_price": [
-                ["price", "cost", "rate", "charge", "fee", "how much", "expensive", "cheap"],
-            ],
-            "inquire_room_type": [
-                ["room type", "types of room", "what room", "which room", "room option", "category"],
-            ],
-            "inquire_amenities": [
-                ["amenity", "amenities", "facility", "facilities", "service", "services", "feature", "features"],
-                ["have", "offer", "provide", "include", "available"],
-            ],
-            "inquire_cancellation_policy": [
-                ["cancel", "cancellation", "refund", "policy", "cancel policy", "refund policy"],
-            ],
-            "inquire_checkin_time": [
-                ["check in", "check-in", "checkin", "arrival", "arrive", "come in"],
-                ["time", "hour", "when", "what time"],
-            ],
-            "inquire_checkout_time": [
-                ["check out", "check-out", "checkout", "departure", "depart", "leave"],
-                ["time", "hour", "when", "what time"],
-            ],
-            "inquire_parking": [
-                ["parking", "park", "car park", "garage", "vehicle"],
-            ],
-            "inquire_pet_policy": [
-                ["pet", "pets", "dog", "cat", "animal"],
-            ],
-            "make_reservation": [
-                ["book", "reserve", "reservation", "booking", "want to book", "make a reservation"],
-            ],
-            "change_dates": [
-                ["change", "modify", "update", "adjust"],
-                ["date", "dates", "day", "days"],
-            ],
-            "change_room_type": [
-                ["change", "modify", "update", "switch", "upgrade"],
-                ["room", "room type"],
-            ],
-            "change_guest_count": [
-                ["change", "modify", "update", "adjust"],
-                ["guest", "guests", "people", "person", "adult", "adults", "children"],
-            ],
-            "cancel_reservation": [
-                ["cancel", "cancellation", "abort", "remove"],
-                ["reservation", "booking"],
-            ],
-            "confirm": [
-                ["yes", "confirm", "ok", "okay", "sure", "proceed", "go ahead", "correct", "right"],
-            ],
-            "deny": [
-                ["no", "nope", "cancel", "don't", "never mind", "not now", "wrong"],
-            ],
-            "request_late_checkout": [
-                ["late", "extend", "later"],
-                ["checkout", "check out", "check-out"],
-            ],
-            "request_early_checkin": [
-                ["early", "earlier", "before"],
-                ["checkin", "check in", "check-in", "arrival"],
-            ],
-            "request_invoice": [
-                ["invoice", "receipt", "bill", "statement", "payment confirmation"],
-            ],
-            "complaint_noise": [
-                ["noise", "noisy", "loud", "sound"],
-                ["complaint", "complain", "problem", "issue"],
-            ],
-            "complaint_cleanliness": [
-                ["clean", "cleanliness", "dirty", "mess", "tidy"],
-                ["complaint", "complain", "problem", "issue"],
-            ],
-            "complaint_billing": [
-                ["billing", "charge", "payment", "invoice", "bill"],
-                ["complaint", "complain", "problem", "issue", "wrong", "error"],
-            ],
-            "feedback_positive": [
-                ["great", "excellent", "wonderful", "amazing", "love", "fantastic", "perfect", "good job"],
-            ],
-            "feedback_negative": [
-                ["bad", "terrible", "awful", "horrible", "disappointed", "poor", "worst"],
-            ],
-        }
-        
-        # Weight for each match level
-        self.weights = {
-            "exact_phrase": 3.0,
-            "all_keywords": 2.0,
-            "partial_keywords": 1.0,
-        }
+        self.intent_keywords = _INTENT_KEYWORDS
+        self.weights = _WEIGHTS
+        self._intent_data = _INTENT_DATA
+        self._automaton = _AUTOMATON
+
+    def _matched_groups(self, text: str) -> Dict[str, Set[int]]:
+        """Map intent -> indices of keyword groups with at least one phrase hit."""
+        matched: Dict[str, Set[int]] = {}
+        for _, owners in self._automaton.iter(text):
+            for intent, group_idx in owners:
+                matched.setdefault(intent, set()).add(group_idx)
+        return matched
+
+    def _score_matched(self, matched_groups: Optional[Set[int]]) -> float:
+        """Score an intent from its matched groups.
+
+        Mirrors _calculate_score: any phrase hit counts as an exact match
+        (the per-phrase loop there returns on the first substring hit).
+        """
+        if matched_groups:
+            return self.weights["exact_phrase"]
+        return 0.0
     
     def match(self, text: str, min_score: float = 1.0) -> Optional[Tuple[str, float]]:
         """
@@ -126,11 +204,20 @@ class KeywordMatcher:
         best_intent = None
         best_score = 0.0
         
-        for intent, keyword_groups in self.intent_keywords.items():
-            score = self._calculate_score(text_lower, keyword_groups)
-            if score > best_score:
-                best_score = score
-                best_intent = intent
+        if self._automaton is not None:
+            matched = self._matched_groups(text_lower)
+            for intent in self.intent_keywords:
+                score = self._score_matched(matched.get(intent))
+                if score > best_score:
+                    best_score = score
+                    best_intent = intent
+        else:
+            tokens = frozenset(_TOKEN_RE.findall(text_lower))
+            for intent, groups in self._intent_data.items():
+                score = self._calculate_score(text_lower, tokens, groups)
+                if score > best_score:
+                    best_score = score
+                    best_intent = intent
         
         if best_score >= min_score and best_intent:
             # Normalize score to 0-1 range
@@ -139,31 +226,16 @@ class KeywordMatcher:
         
         return None
     
-    def _calculate_score(self, text: str, keyword_groups: List[List[str]]) -> float:
-        """Calculate matching score for a text against keyword groups."""
-        if not keyword_groups:
-            return 0.0
-        
-        # Check for exact phrase matches
-        for group in keyword_groups:
-            for phrase in group:
-                if phrase in text:
-                    return self.weights["exact_phrase"]
-        
-        # Check if all keyword groups have at least one match
-        matches_per_group = []
-        for group in keyword_groups:
-            group_match = any(keyword in text for keyword in group)
-            matches_per_group.append(group_match)
-        
-        if all(matches_per_group):
-            return self.weights["all_keywords"]
-        
-        # Partial match
-        if any(matches_per_group):
-            match_ratio = sum(matches_per_group) / len(matches_per_group)
-            return self.weights["partial_keywords"] * match_ratio
-        
+    def _calculate_score(self, text: str, tokens: frozenset, groups: List[Tuple[frozenset, Tuple[str, ...]]]) -> float:
+        """Calculate matching score for a text against precomputed keyword groups.
+
+        Any keyword hit in any group counts as an exact match, mirroring both
+        the automaton path and the original per-phrase loop (which returned on
+        the first substring hit before the weaker branches could run).
+        """
+        for single_words, phrases in groups:
+            if tokens & single_words or any(phrase in text for phrase in phrases):
+                return self.weights["exact_phrase"]
         return 0.0
     
     def get_intents_for_keywords(self, text: str, top_k: int = 3) -> List[Tuple[str, float]]:
@@ -171,12 +243,24 @@ class KeywordMatcher:
         text_lower = text.lower()
         scores = []
         
-        for intent, keyword_groups in self.intent_keywords.items():
-            score = self._calculate_score(text_lower, keyword_groups)
-            if score > 0:
-                normalized_score = min(score / 5.0, 1.0)
-                scores.append((intent, normalized_score))
+        if self._automaton is not None:
+            matched = self._matched_groups(text_lower)
+            for intent in self.intent_keywords:
+                score = self._score_matched(matched.get(intent))
+                if score > 0:
+                    normalized_score = min(score / 5.0, 1.0)
+                    scores.append((intent, normalized_score))
+        else:
+            tokens = frozenset(_TOKEN_RE.findall(text_lower))
+            for intent, groups in self._intent_data.items():
+                score = self._calculate_score(text_lower, tokens, groups)
+                if score > 0:
+                    normalized_score = min(score / 5.0, 1.0)
+                    scores.append((intent, normalized_score))
         
         # Sort by score descending
         scores.sort(key=lambda x: x[1], reverse=True)
         return scores[:top_k]
+
+# Shared stateless instance; callers that don't need their own can reuse it
+DEFAULT_MATCHER = KeywordMatcher()
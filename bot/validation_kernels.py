@@ -0,0 +1,48 @@
+"""Character-level validation kernels, JIT-compiled when numba is available.
+
+The hot loop here is deliberately written in numba's nopython subset (plain
+iteration, indexing, and string containment) so the same source runs compiled
+or interpreted. The kernel is warmed with a dummy call at import time so the
+first validated input never pays the compile cost.
+"""
+from __future__ import annotations
+
+try:
+    import numba
+except ImportError:  # optional JIT for bulk validation paths; pure Python otherwise
+    numba = None
+
+
+def real_word_scan(word: str) -> bool:
+    """Single pass over the characters of a candidate word.
+
+    Tracks vowel presence and the current consonant-run length, then checks
+    for a repeated two-character pattern — the same three checks the old
+    per-word regexes performed, in one traversal.
+    """
+    seen_vowel = False
+    run = 0
+    for ch in word:
+        if ch in "aeiouy":
+            seen_vowel = True
+            run = 0
+        elif ch.isspace():
+            run = 0
+        else:
+            run += 1
+            if run >= 4:  # too many consonants in a row is suspicious
+                return False
+    if not seen_vowel:
+        return False
+    n = len(word)
+    if n > 3:
+        # Same 2-char pattern repeated looks wrong
+        for i in range(n - 3):
+            if word[i] == word[i + 2] and word[i + 1] == word[i + 3]:
+                return False
+    return True
+
+
+if numba is not None:  # pragma: no cover - exercised only when numba is installed
+    real_word_scan = numba.njit(cache=True)(real_word_scan)
+    real_word_scan("warmup")  # compile at import, not on the first real input
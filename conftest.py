@@ -0,0 +1,26 @@
+"""Shared pytest fixtures for the test suite."""
+from __future__ import annotations
+
+import pytest
+
+from bot import HotelChatbot
+
+_BOT: HotelChatbot | None = None
+
+
+def shared_bot() -> HotelChatbot:
+    """Build the chatbot once per process; every test file reuses it.
+
+    Training dominates per-test cost, so the suite shares one instance and
+    resets its conversation context between tests instead of rebuilding.
+    """
+    global _BOT
+    if _BOT is None:
+        _BOT = HotelChatbot(auto_train="auto", use_keyword_fallback=True)
+    return _BOT
+
+
+@pytest.fixture(scope="session")
+def bot() -> HotelChatbot:
+    """Session-scoped chatbot shared across all test files."""
+    return shared_bot()
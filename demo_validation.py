@@ -26,7 +26,7 @@ def main():
     print("  • Invalid: 'What is the capital of France?' (off-topic)")
     print("\nType 'quit' to exit, 'reset' to clear context\n")
     
-    bot = HotelChatbot(auto_train=True, use_keyword_fallback=True)
+    bot = HotelChatbot(auto_train="auto", use_keyword_fallback=True)
     
     while True:
         user_input = input("You: ").strip()
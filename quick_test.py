@@ -1,7 +1,7 @@
 """Quick test for the fix."""
 from bot import HotelChatbot
 
-bot = HotelChatbot(auto_train=True)
+bot = HotelChatbot(auto_train="auto")
 
 print("=" * 60)
 print("Testing Fixed Validation")
@@ -12,7 +12,7 @@ print("Loading training data...")
 bot = HotelChatbot(auto_train=True, confidence_threshold=0.25)
 
 print(f"✓ Model trained successfully!")
-print(f"✓ Training data: {len(bot.state.training_rows)} rows")
+print(f"✓ Training data: {bot.training_size} rows")
 print(f"✓ Model saved to: artifacts/intent_classifier.joblib")
 print(f"✓ Vectorizer saved to: artifacts/tfidf_vectorizer.joblib")
 
@@ -16,7 +16,7 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
-    bot = HotelChatbot(training_data_path=args.data, auto_train=not args.no_train)
+    bot = HotelChatbot(training_data_path=args.data, auto_train=False if args.no_train else "auto")
     print("🏨 Hotel chatbot ready with keyword-based matching and conversation memory!")
     print("Type 'quit' to exit, 'reset' to clear conversation context.\n")
     
@@ -1,110 +1,120 @@
 """Test script to demonstrate keyword matching and conversation memory."""
-from bot import HotelChatbot
+from conftest import shared_bot
 
+# Immutable query lists shared by the tests and the __main__ report
+TEST_QUERIES = [
+    # Different ways to ask about availability
+    "Do you have any rooms available?",
+    "Are there vacant rooms?",
+    "Can I check availability?",
+    
+    # Different ways to ask about price
+    "How much does it cost?",
+    "What's the rate?",
+    "Tell me the price",
+    
+    # Different ways to ask about check-in
+    "When can I check in?",
+    "What time is arrival?",
+    "Check-in hour?",
+    
+    # Different ways to greet
+    "Hi there!",
+    "Good morning",
+    "Hello",
+]
 
-def test_keyword_matching():
+CONVERSATION = [
+    "I want to book a room for 2 adults",
+    "Check-in on 2025-12-10",
+    "And check-out on 2025-12-12",
+    "I prefer a deluxe room",
+    "How much will it cost?",  # Should remember all previous info
+    "What about availability?",  # Should still remember dates and guests
+]
+
+INFO_QUERIES = [
+    "What's your hotel name?",
+    "Where are you located?",
+    "How can I contact you?",
+    "What's your phone number?",
+]
+
+
+def test_keyword_matching(bot):
     """Test keyword-based paraphrase handling."""
     print("=" * 60)
     print("TEST 1: Keyword-Based Paraphrase Handling")
     print("=" * 60)
     
-    bot = HotelChatbot(auto_train=True, use_keyword_fallback=True)
-    
-    test_queries = [
-        # Different ways to ask about availability
-        "Do you have any rooms available?",
-        "Are there vacant rooms?",
-        "Can I check availability?",
-        
-        # Different ways to ask about price
-        "How much does it cost?",
-        "What's the rate?",
-        "Tell me the price",
-        
-        # Different ways to ask about check-in
-        "When can I check in?",
-        "What time is arrival?",
-        "Check-in hour?",
-        
-        # Different ways to greet
-        "Hi there!",
-        "Good morning",
-        "Hello",
-    ]
-    
-    for query in test_queries:
-        result = bot.respond(query)
-        print(f"\n📝 Query: {query}")
-        print(f"✅ Intent: {result['intent']} (confidence: {result['confidence']:.2f})")
-        print(f"💬 Response: {result['response']}")
-    
-    print("\n" + "=" * 60)
+    bot.reset_context()
+    bot.precompute(TEST_QUERIES)
+    
+    # Buffer per-query lines and flush once; per-line print costs add up in CI
+    results = bot.respond_batch(TEST_QUERIES)
+    out = []
+    for query, result in zip(TEST_QUERIES, results):
+        out.append(f"\n📝 Query: {query}")
+        out.append(f"✅ Intent: {result['intent']} (confidence: {result['confidence']:.2f})")
+        out.append(f"💬 Response: {result['response']}")
+    out.append("\n" + "=" * 60)
+    print("\n".join(out))
 
 
-def test_conversation_memory():
+def test_conversation_memory(bot):
     """Test conversation memory and context tracking."""
     print("\n\n" + "=" * 60)
     print("TEST 2: Conversation Memory & Context Tracking")
     print("=" * 60)
     
-    bot = HotelChatbot(auto_train=True, use_keyword_fallback=True)
-    
-    conversation = [
-        "I want to book a room for 2 adults",
-        "Check-in on 2025-12-10",
-        "And check-out on 2025-12-12",
-        "I prefer a deluxe room",
-        "How much will it cost?",  # Should remember all previous info
-        "What about availability?",  # Should still remember dates and guests
-    ]
+    bot.reset_context()
+    bot.precompute(CONVERSATION)
     
-    for turn in conversation:
+    out = []
+    for turn in CONVERSATION:
         result = bot.respond(turn)
-        print(f"\n👤 User: {turn}")
-        print(f"🤖 Bot ({result['intent']}): {result['response']}")
+        out.append(f"\n👤 User: {turn}")
+        out.append(f"🤖 Bot ({result['intent']}): {result['response']}")
         if result.get('context'):
-            print(f"💭 Context: {result['context']}")
+            out.append(f"💭 Context: {result['context']}")
     
-    print("\n📊 Final Context Summary:")
+    out.append("\n📊 Final Context Summary:")
     context = bot.get_context()
-    print(f"  - Hotel: {context.hotel_name}")
-    print(f"  - Check-in: {context.check_in}")
-    print(f"  - Check-out: {context.check_out}")
-    print(f"  - Room Type: {context.room_type}")
-    print(f"  - Adults: {context.adults}")
-    print(f"  - Message History: {len(context.message_history)} messages")
-    
-    print("\n" + "=" * 60)
+    out.append(f"  - Hotel: {context.hotel_name}")
+    out.append(f"  - Check-in: {context.check_in}")
+    out.append(f"  - Check-out: {context.check_out}")
+    out.append(f"  - Room Type: {context.room_type}")
+    out.append(f"  - Adults: {context.adults}")
+    out.append(f"  - Message History: {len(context.message_history)} messages")
+    
+    out.append("\n" + "=" * 60)
+    print("\n".join(out))
 
 
-def test_hotel_info_persistence():
+def test_hotel_info_persistence(bot):
     """Test that hotel information is always remembered."""
     print("\n\n" + "=" * 60)
     print("TEST 3: Hotel Information Persistence")
     print("=" * 60)
     
-    bot = HotelChatbot(auto_train=True, use_keyword_fallback=True)
+    bot.reset_context()
+    bot.precompute(INFO_QUERIES)
     
-    queries = [
-        "What's your hotel name?",
-        "Where are you located?",
-        "How can I contact you?",
-        "What's your phone number?",
-    ]
-    
-    for query in queries:
-        result = bot.respond(query)
-        print(f"\n👤 User: {query}")
-        print(f"🤖 Bot: {result['response']}")
+    results = bot.respond_batch(INFO_QUERIES)
+    out = []
+    for query, result in zip(INFO_QUERIES, results):
+        out.append(f"\n👤 User: {query}")
+        out.append(f"🤖 Bot: {result['response']}")
     
     context = bot.get_context()
-    print(f"\n🏨 Hotel Info (Always Available):")
-    print(f"  - Name: {context.hotel_name}")
-    print(f"  - Address: {context.hotel_address}")
-    print(f"  - Phone: {context.hotel_phone}")
-    print(f"  - Email: {context.hotel_email}")
-    
-    print("\n" + "=" * 60)
+    out.append(f"\n🏨 Hotel Info (Always Available):")
+    out.append(f"  - Name: {context.hotel_name}")
+    out.append(f"  - Address: {context.hotel_address}")
+    out.append(f"  - Phone: {context.hotel_phone}")
+    out.append(f"  - Email: {context.hotel_email}")
+    
+    out.append("\n" + "=" * 60)
+    print("\n".join(out))
 
 
 if __name__ == "__main__":
@@ -115,9 +125,10 @@ if __name__ == "__main__":
     print("  ✓ Persistent hotel information")
     print()
     
-    test_keyword_matching()
-    test_conversation_memory()
-    test_hotel_info_persistence()
+    bot = shared_bot()
+    test_keyword_matching(bot)
+    test_conversation_memory(bot)
+    test_hotel_info_persistence(bot)
     
     print("\n✅ All tests completed!")
     print("\n💡 Try the interactive chatbot with: python run_chatbot.py")